@@ -1,121 +1,168 @@
 """Configuration loading from environment variables and files."""
 
-import json
+import functools
 import logging
 import os
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
+import orjson
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, field_validator
 
 __all__ = ["Settings", "load_settings"]
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
-_http_url_adapter = TypeAdapter(HttpUrl)
+_dotenv_loaded = False
+
+
+def _validate_http_url(v: str) -> str:
+    """Validate that a URL is an absolute http:// URL with a host.
+
+    Args:
+        v: URL to validate.
+
+    Returns:
+        The validated URL.
+
+    Raises:
+        ValueError: If URL is malformed, has no host, or is not http.
+    """
+    url = urlsplit(v)
+    if url.scheme != "http":
+        raise ValueError("Only http:// endpoints allowed")
+    if not url.hostname:
+        raise ValueError(f"URL has no host: {v!r}")
+    _ = url.port  # raises ValueError on an out-of-range or non-numeric port
+    return v
 
 
-class Settings(BaseModel):
+@dataclass(slots=True)
+class Settings:
     """Runtime configuration for the propagator service.
 
+    A plain dataclass with hand-written validation: keeping pydantic out of
+    this module keeps the import (and so service startup) cheap.
+
     Attributes:
         period_in_sec: Interval between events in seconds (must be positive).
         http_post_endpoint: HTTP endpoint that will receive events.
-        http_health_endpoint: Optional endpoint to probe before starting.
         payload_file_path: Path to JSON file with event payloads.
+        http_health_endpoint: Optional endpoint to probe before starting.
+        concurrency: Requests sent per period (must be positive).
         payloads: List of event payload objects (loaded from file).
+        payload_bodies: Payloads pre-serialized to JSON bytes, index-aligned with payloads.
     """
 
-    period_in_sec: int = Field(..., gt=0, description="Interval between events in seconds.")
-    http_post_endpoint: str = Field(..., description="HTTP endpoint that will receive events.")
-    http_health_endpoint: str | None = Field(
-        default=None,
-        description=(
-            "Optional HTTP endpoint to probe for health. "
-            "If not set, no health check is performed."
-        ),
-    )
-    payload_file_path: str = Field(..., description="Path to JSON file containing event payloads")
-    payloads: list[dict[str, Any]] = Field(
-        default_factory=list,
-        description="List of event payloads (populated from file).",
-    )
-
-    @field_validator("http_post_endpoint")
-    @classmethod
-    def validate_http_post_endpoint(cls, v: str) -> str:
-        """Validate that endpoint is a valid HTTP(S) URL.
+    period_in_sec: int
+    http_post_endpoint: str
+    payload_file_path: str
+    http_health_endpoint: str | None = None
+    concurrency: int = 1
+    payloads: list[dict[str, Any]] = field(default_factory=list)
+    payload_bodies: tuple[bytes, ...] = ()
 
-        Args:
-            v: Endpoint URL to validate.
-
-        Returns:
-            The validated URL.
+    def __post_init__(self) -> None:
+        """Validate period, concurrency and endpoints.
 
         Raises:
-            ValueError: If URL is invalid or not http.
+            ValueError: If the period or concurrency is not positive, or an
+                endpoint is invalid.
         """
+        if self.period_in_sec <= 0:
+            raise ValueError(f"period_in_sec must be positive (got: {self.period_in_sec})")
+        if self.concurrency <= 0:
+            raise ValueError(f"concurrency must be positive (got: {self.concurrency})")
         try:
-            url = _http_url_adapter.validate_python(v)
-            if url.scheme not in ("http"):
-                raise ValueError("Only http:// endpoints allowed")
-        except Exception as e:
+            _validate_http_url(self.http_post_endpoint)
+        except ValueError as e:
             raise ValueError(f"Invalid HTTP endpoint: {e}") from e
-        return v
-
-    @field_validator("http_health_endpoint")
-    @classmethod
-    def validate_http_health_endpoint(cls, v: str | None) -> str | None:
-        """Validate that health endpoint (if provided) is a valid HTTP(S) URL.
-
-        Args:
-            v: Health endpoint URL to validate (can be None).
-
-        Returns:
-            The validated URL or None.
-
-        Raises:
-            ValueError: If URL is invalid or not http.
-        """
-        if v is None:
-            return v
-        try:
-            url = _http_url_adapter.validate_python(v)
-            if url.scheme not in ("http"):
-                raise ValueError("Only http:// endpoints allowed")
-        except Exception as e:
-            raise ValueError(f"Invalid health endpoint: {e}") from e
-        return v
+        if self.http_health_endpoint is not None:
+            try:
+                _validate_http_url(self.http_health_endpoint)
+            except ValueError as e:
+                raise ValueError(f"Invalid health endpoint: {e}") from e
 
     def load_payloads(self) -> None:
         """Load and validate payloads from JSON file.
 
+        Payloads never change after loading, so each one is also serialized
+        to its JSON request body here, once, instead of on every send.
+        Parsing and serialization are cached per file version (see
+        _parse_payloads_cached).
+
         Raises:
             ValueError: If file not found, invalid JSON, wrong format, or empty.
         """
         try:
-            with open(self.payload_file_path) as f:
-                data = json.load(f)
+            st = os.stat(self.payload_file_path)
         except FileNotFoundError as e:
             raise ValueError(f"Payload file not found: {self.payload_file_path}") from e
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Payload file contains invalid JSON: {self.payload_file_path}") from e
-
-        if not isinstance(data, list):
-            raise ValueError("Payload file must be a JSON array")
-        if not data:
-            raise ValueError("Payload file is empty")
-        if not all(isinstance(x, dict) for x in data):
+
+        data, bodies = _parse_payloads_cached(self.payload_file_path, st.st_mtime_ns, st.st_size)
+
+        self.payloads = list(data)
+        self.payload_bodies = bodies
+        logger.debug("Loaded %d payloads from %s", len(data), self.payload_file_path)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_payloads_cached(
+    path: str, mtime_ns: int, size: int
+) -> tuple[tuple[dict[str, Any], ...], tuple[bytes, ...]]:
+    """Read, parse, validate and re-serialize a payload file, memoized per file version.
+
+    The modification time and size are part of the cache key, so an edited
+    file is parsed again while an unchanged one is read only once. Cached
+    payloads are shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the JSON payload file.
+        mtime_ns: File modification time in nanoseconds (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        Validated payload objects and their compact JSON bodies, index-aligned.
+
+    Raises:
+        ValueError: If file not found, invalid JSON, wrong format, or empty.
+    """
+    try:
+        raw = Path(path).read_bytes()
+    except FileNotFoundError as e:
+        raise ValueError(f"Payload file not found: {path}") from e
+
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Payload file contains invalid JSON: {path}") from e
+
+    if not isinstance(data, list):
+        raise ValueError("Payload file must be a JSON array")
+    if not data:
+        raise ValueError("Payload file is empty")
+
+    # Check and serialize each payload in the same pass over the array
+    dumps = orjson.dumps
+    bodies = []
+    for payload in data:
+        if not isinstance(payload, dict):
             raise ValueError("Each payload must be a JSON object")
+        bodies.append(dumps(payload))
 
-        self.payloads = data
-        logger.debug(f"Loaded {len(data)} payloads from {self.payload_file_path}")
+    return tuple(data), tuple(bodies)
 
 
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
     """Load and validate settings from environment and files.
 
+    The `.env` file is parsed lazily on first call, and the resulting
+    Settings are cached for the lifetime of the process so that repeated
+    callers share one parsed configuration.
+    Use `load_settings.cache_clear()` to force a reload.
+
     Required environment variables:
     - PERIOD_IN_SECONDS: Positive integer for event interval.
     - HTTP_POST_ENDPOINT: Valid HTTP(S) URL for consumer.
@@ -123,6 +170,7 @@ def load_settings() -> Settings:
 
     Optional:
     - HEALTH_CHECK_ENDPOINT: URL to probe before starting.
+    - CONCURRENCY: Positive integer, requests sent per period (default 1).
 
     Returns:
         Validated Settings object.
@@ -131,14 +179,21 @@ def load_settings() -> Settings:
         RuntimeError: If required env vars missing or invalid.
         ValueError: If configuration is invalid.
     """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+    env = os.environ
     try:
-        period_raw = os.environ["PERIOD_IN_SECONDS"]
-        http_endpoint = os.environ["HTTP_POST_ENDPOINT"]
-        payload_path = os.environ["PAYLOAD_FILE_PATH"]
+        period_raw = env["PERIOD_IN_SECONDS"]
+        http_endpoint = env["HTTP_POST_ENDPOINT"]
+        payload_path = env["PAYLOAD_FILE_PATH"]
     except KeyError as e:
         raise RuntimeError(f"Missing required environment variable: {e.args[0]}") from e
 
-    health_check_endpoint = os.getenv("HEALTH_CHECK_ENDPOINT")
+    health_check_endpoint = env.get("HEALTH_CHECK_ENDPOINT")
+    concurrency_raw = env.get("CONCURRENCY", "1")
 
     try:
         period_in_sec = int(period_raw)
@@ -149,10 +204,20 @@ def load_settings() -> Settings:
             f"PERIOD_IN_SECONDS must be a positive integer (got: {period_raw})"
         ) from e
 
+    try:
+        concurrency = int(concurrency_raw)
+        if concurrency <= 0:
+            raise ValueError("Must be positive")
+    except ValueError as e:
+        raise RuntimeError(
+            f"CONCURRENCY must be a positive integer (got: {concurrency_raw})"
+        ) from e
+
     settings = Settings(
         period_in_sec=period_in_sec,
         http_post_endpoint=http_endpoint,
         http_health_endpoint=health_check_endpoint,
+        concurrency=concurrency,
         payload_file_path=payload_path,
     )
 
@@ -160,10 +225,13 @@ def load_settings() -> Settings:
     settings.load_payloads()
 
     logger.info(
-        f"Propagator configured: period={settings.period_in_sec}s, "
-        f"endpoint={settings.http_post_endpoint}, "
-        f"payloads={len(settings.payloads)}, "
-        f"health_check={settings.http_health_endpoint or '<disabled>'}"
+        "Propagator configured: period=%ss, endpoint=%s, payloads=%d, concurrency=%d, "
+        "health_check=%s",
+        settings.period_in_sec,
+        settings.http_post_endpoint,
+        len(settings.payloads),
+        settings.concurrency,
+        settings.http_health_endpoint or "<disabled>",
     )
 
     return settings
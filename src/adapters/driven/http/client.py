@@ -1,14 +1,15 @@
 """HTTP client adapter with retry and metrics integration."""
 
-import asyncio
 import logging
+import time
 from types import TracebackType
 
 import aiohttp
 from aiohttp import ClientResponse, ClientTimeout
+from yarl import URL
 
 from src.adapters.driven.http.retry import retry
-from src.ports.http import HttpPort
+from src.ports.http import MAX_INFLIGHT_REQUESTS, HttpPort
 from src.ports.metrics import HttpAttemptDto, MetricsPort
 
 __all__ = ["HttpClient"]
@@ -18,8 +19,15 @@ logger = logging.getLogger(__name__)
 # Configurable retry settings
 PROBE_RETRIES = 5
 PROBE_TIMEOUT = 10
+PROBE_CLIENT_TIMEOUT = ClientTimeout(total=PROBE_TIMEOUT)  # shared, immutable
 REQUEST_RETRIES = 3
 FIRST_FAILING_HTTP_CODE = 400
+JSON_HEADERS = {"Content-Type": "application/json"}  # shared, never mutated
+
+# Connection pool settings
+MIN_KEEPALIVE_TIMEOUT = 30
+KEEPALIVE_PERIODS = 10  # keep idle connections alive across this many periods
+DNS_CACHE_TTL = 300
 
 
 class HttpClient:
@@ -30,16 +38,32 @@ class HttpClient:
     - Metrics collection (jitter, failure rate).
     - Context manager for proper resource cleanup.
     - Health check/probe functionality.
+    - Target URLs parsed once and reused for every request.
+    - Pooled keep-alive connections sized for a single consumer endpoint.
     """
 
-    def __init__(self, metrics: MetricsPort | None = None) -> None:
+    def __init__(
+        self,
+        metrics: MetricsPort | None = None,
+        period_in_sec: float | None = None,
+        connection_limit: int = MAX_INFLIGHT_REQUESTS,
+    ) -> None:
         """Initialize HTTP client.
 
         Args:
             metrics: Optional metrics collector to track attempts.
+            period_in_sec: Optional send period, used to keep idle connections
+                open between periodic requests instead of reconnecting.
+            connection_limit: Maximum number of pooled connections; size it
+                with max_inflight_requests() to match the core's send workers.
         """
         self.metrics = metrics
+        self.connection_limit = connection_limit
+        self.keepalive_timeout: float = MIN_KEEPALIVE_TIMEOUT
+        if period_in_sec is not None:
+            self.keepalive_timeout = max(MIN_KEEPALIVE_TIMEOUT, period_in_sec * KEEPALIVE_PERIODS)
         self.session: aiohttp.ClientSession | None = None
+        self._urls: dict[str, URL] = {}
 
     async def __aenter__(self) -> "HttpClient":
         """Enter async context manager (start session).
@@ -47,7 +71,13 @@ class HttpClient:
         Returns:
             Self for use in async with statement.
         """
-        self.session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=PROBE_CLIENT_TIMEOUT)
         return self
 
     async def __aexit__(
@@ -83,7 +113,9 @@ class HttpClient:
         """
         if self.session is None:
             raise RuntimeError("Session not initialized; use 'async with' context manager")
-        client_timeout = ClientTimeout(timeout)
+        client_timeout = (
+            PROBE_CLIENT_TIMEOUT if timeout == PROBE_TIMEOUT else ClientTimeout(total=timeout)
+        )
         return await self.session.get(url, timeout=client_timeout, allow_redirects=True)
 
     async def probe(self, url: str, timeout: int = PROBE_TIMEOUT) -> bool:
@@ -98,22 +130,38 @@ class HttpClient:
         Returns:
             True if reachable ( 200 <= status < 300), False otherwise.
         """
-        logger.info(f"Probing endpoint {url}...")
+        logger.info("Probing endpoint %s...", url)
         try:
             resp = await self._probe_once(url, timeout)
             is_healthy = 200 <= resp.status < 300
-            logger.info(f"Probe for {url} returned status {resp.status}")
+            logger.info("Probe for %s returned status %s", url, resp.status)
             return is_healthy
         except Exception as e:
-            logger.warning(f"Probe failed for {url}: {e}")
+            logger.warning("Probe failed for %s: %s", url, e)
             return False
 
+    def _resolve_url(self, url: str) -> URL:
+        """Return the parsed form of a URL, parsing it only on first use.
+
+        Passing a pre-built URL lets aiohttp skip its own parsing per request.
+
+        Args:
+            url: URL string to resolve.
+
+        Returns:
+            Parsed URL.
+        """
+        parsed = self._urls.get(url)
+        if parsed is None:
+            parsed = self._urls[url] = URL(url)
+        return parsed
+
     @retry(times=REQUEST_RETRIES)
     async def _raw_request(self, req: HttpPort) -> ClientResponse:
         """Single HTTP POST request (with retry via decorator).
 
         Args:
-            req: HTTP request object with URL and payload.
+            req: HTTP request object with URL and pre-serialized JSON body.
 
         Returns:
             HTTP response.
@@ -125,13 +173,16 @@ class HttpClient:
         if self.session is None:
             raise RuntimeError("Session not initialized; use 'async with' context manager")
 
-        return await self.session.post(req.url, json=req.payload)
+        return await self.session.post(
+            self._resolve_url(req.url), data=req.body, headers=JSON_HEADERS
+        )
 
     async def request(self, req: HttpPort) -> ClientResponse:
         """Send HTTP request and record metrics.
 
         Measures jitter (deviation from scheduled time) and records
-        success/failure for statistics.
+        success/failure for statistics. The metrics summary is logged
+        periodically, not on every response.
 
         Args:
             req: HTTP request object.
@@ -139,21 +190,20 @@ class HttpClient:
         Returns:
             HTTP response.
         """
-        loop = asyncio.get_running_loop()
-        scheduled = req.ideal_time_sec
-        fired = loop.time()
+        fired_ns = time.monotonic_ns()
 
         resp = await self._raw_request(req=req)
 
         if self.metrics:
+            status = resp.status
+            # Positional: (scheduled_at_ns, fired_at_ns, is_failed, status_code)
             self.metrics.update(
                 HttpAttemptDto(
-                    scheduled_at_sec=scheduled,
-                    fired_at_sec=fired,
-                    is_failed=resp.status >= FIRST_FAILING_HTTP_CODE,
-                    status_code=resp.status,
+                    req.ideal_time_ns, fired_ns, status >= FIRST_FAILING_HTTP_CODE, status
                 )
             )
-            logger.info(f"HTTP metrics: {self.metrics}")
+            # Rendering the summary is the costly part: only do it when one is due
+            if self.metrics.should_log() and logger.isEnabledFor(logging.INFO):
+                logger.info("HTTP metrics: %s", self.metrics)
 
         return resp
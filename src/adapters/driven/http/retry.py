@@ -1,16 +1,21 @@
 """Retry logic for transient HTTP errors."""
 
 import asyncio
+import logging
 from collections.abc import Awaitable, Callable
 from functools import wraps
+from typing import Final
 
 import aiohttp
 from aiohttp import ClientResponse
 
 __all__ = ["retry", "RETRYABLE_ERRORS"]
 
-# Exceptions considered transient and eligible for retry
-RETRYABLE_ERRORS = (
+logger = logging.getLogger(__name__)
+
+# Exceptions considered transient and eligible for retry. A tuple, so the
+# `except` clauses below match against it directly (no isinstance() re-checks)
+RETRYABLE_ERRORS: Final[tuple[type[BaseException], ...]] = (
     aiohttp.ClientConnectorError,  # Connection refused, DNS failed
     aiohttp.ClientConnectionError,  # Connection error
     aiohttp.ClientOSError,  # OS-level network error
@@ -37,35 +42,39 @@ def retry(
     Returns:
         Decorator function.
 
+    Raises:
+        ValueError: If times is lower than 1.
+
     Example:
         @retry(times=3, delay_sec=(0.2, 0.5, 1.0))
         async def my_http_call():
             return await session.get(url)
     """
 
+    if times < 1:
+        raise ValueError(f"times must be >= 1 (got: {times})")
+    # Sleep before each retry, resolved once here rather than per attempt
+    # (attempts past the end of delay_sec reuse its last value)
+    last_delay_idx = len(delay_sec) - 1
+    schedule = tuple(delay_sec[min(attempt, last_delay_idx)] for attempt in range(times - 1))
+
     def decorator(func: AsyncHttpFn) -> AsyncHttpFn:
         @wraps(func)
         async def wrapper(*args: object, **kwargs: object) -> ClientResponse:
-            last_exc: BaseException | None = None
-
-            for attempt in range(times):
+            # All but the last attempt: transient errors sleep and retry.
+            # Non-transient errors propagate immediately (no retry).
+            for delay in schedule:
                 try:
                     return await func(*args, **kwargs)
-                except RETRYABLE_ERRORS as e:
-                    last_exc = e
-                    if attempt == times - 1:
-                        # Last attempt failed, log and raise
-                        logger = __import__("logging").getLogger(__name__)
-                        logger.debug(f"Retry exhausted after {times} attempts: {e}")
-                        raise
-                    # Sleep before retry with exponential backoff
-                    delay_idx = min(attempt, len(delay_sec) - 1)
-                    await asyncio.sleep(delay_sec[delay_idx])
-                except Exception:
-                    # Non-transient errors: do not retry
-                    raise
-
-            raise last_exc or RuntimeError("Retry wrapper exhausted")
+                except RETRYABLE_ERRORS:
+                    await asyncio.sleep(delay)
+
+            # Last attempt: nothing left to retry, let errors propagate
+            try:
+                return await func(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                logger.debug("Retry exhausted after %d attempts: %s", times, e)
+                raise
 
         return wrapper
 
@@ -13,7 +13,13 @@ def configure_logs() -> None:
     - Framework loggers (aiohttp, asyncio) at WARNING level.
     - Application loggers (src) at DEBUG level.
     - Structured format with timestamp, level, module, and line number.
+    - No thread/process info on log records (unused by the format).
     """
+    # The format never prints them, so skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     log_format = "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
     date_format = "%d/%m/%y %H:%M:%S"
 
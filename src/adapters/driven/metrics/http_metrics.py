@@ -2,22 +2,14 @@
 
 from __future__ import annotations
 
-import statistics
-from collections import deque
-from dataclasses import dataclass
+import time
+from array import array
 
 from src.ports.metrics import HttpAttemptDto, MetricsPort
 
 __all__ = ["Metrics"]
 
-
-@dataclass(slots=True, frozen=True)
-class _Sample:
-    """Internal record for one HTTP attempt."""
-
-    jitter_ms: float
-    failed: bool
-    status_code: int
+NS_PER_MS = 1_000_000
 
 
 class Metrics(MetricsPort):
@@ -29,16 +21,43 @@ class Metrics(MetricsPort):
     - Last status code.
     - Total attempts seen.
 
+    Samples live in fixed-size ring buffers (one array per field) and the
+    window aggregates are maintained incrementally, so both update() and
+    __str__() run in O(1) regardless of window size. Jitter is kept as
+    integer nanoseconds (exact running sums, no float drift) and only
+    converted to milliseconds when rendered.
+
+    Summaries are meant to be logged in batches: should_log() is True once
+    every `log_every` attempts or `log_interval_sec` seconds, whichever
+    comes first.
+
     Not thread-safe; create one instance per event loop.
     """
 
-    def __init__(self, *, window_size: int = 100) -> None:
+    # One-line summary rendered by __str__ (%-template: parsed by a single C call)
+    _FMT = "jitter=%5.1f ms | status=%3d | fail=%5.1f%% | win=%d/%d | total=%d"
+
+    def __init__(
+        self, *, window_size: int = 100, log_every: int = 100, log_interval_sec: float = 10.0
+    ) -> None:
         """Initialize metrics collector.
 
         Args:
             window_size: Number of recent attempts to keep for statistics.
+            log_every: Attempts between two summaries.
+            log_interval_sec: Maximum seconds between two summaries.
         """
-        self._window: deque[_Sample] = deque(maxlen=window_size)
+        self._window_size = window_size
+        self._log_every = log_every
+        self._log_interval_sec = log_interval_sec
+        self._logged_at_total: int = 0
+        self._logged_at_sec: float = float("-inf")
+        self._jitter_ns = array("q", [0]) * window_size
+        self._failed = array("B", [0]) * window_size
+        self._cursor: int = 0
+        self._jitter_sum_ns: int = 0
+        self._failures: int = 0
+        self._last_status: int = 0
         self._total_seen: int = 0
 
     def update(self, attempt: HttpAttemptDto) -> None:
@@ -47,35 +66,56 @@ class Metrics(MetricsPort):
         Args:
             attempt: HTTP attempt with timing and result info.
         """
-        jitter_ms = (attempt.fired_at_sec - attempt.scheduled_at_sec) * 1_000.0
-        self._window.append(
-            _Sample(
-                jitter_ms=jitter_ms,
-                failed=attempt.is_failed,
-                status_code=attempt.status_code or 0,
-            )
-        )
+        jitter_ns = attempt.fired_at_ns - attempt.scheduled_at_ns
+        failed = int(attempt.is_failed)
+        i = self._cursor
+
+        # Swap the overwritten sample out of the running sums. Slots start at
+        # zero, so while the window is filling up this subtracts nothing.
+        self._jitter_sum_ns += jitter_ns - self._jitter_ns[i]
+        self._failures += failed - self._failed[i]
+        self._jitter_ns[i] = jitter_ns
+        self._failed[i] = failed
+        i += 1
+        self._cursor = 0 if i == self._window_size else i
+        self._last_status = attempt.status_code or 0
         self._total_seen += 1
 
+    def should_log(self) -> bool:
+        """Tell whether a summary is due and, if so, mark it as emitted.
+
+        Returns:
+            True if `log_every` attempts or `log_interval_sec` seconds have
+            passed since the previous summary (always True the first time).
+        """
+        now = time.monotonic()
+        if (
+            self._total_seen - self._logged_at_total < self._log_every
+            and now - self._logged_at_sec < self._log_interval_sec
+        ):
+            return False
+        self._logged_at_total = self._total_seen
+        self._logged_at_sec = now
+        return True
+
     def __str__(self) -> str:
         """Return human-readable one-line summary for logging.
 
         Returns:
             Formatted metrics string.
         """
-        if not self._window:
+        n_window = min(self._total_seen, self._window_size)
+        if not n_window:
             return "Metrics: waiting for data …"
 
-        n_window = len(self._window)
-        failures = sum(1 for s in self._window if s.failed)
-        fail_pct = (failures / n_window) * 100
-        avg_jitter = statistics.fmean(s.jitter_ms for s in self._window)
-        last = self._window[-1]
-
-        return (
-            f"jitter={avg_jitter:5.1f} ms | "
-            f"status={last.status_code:3d} | "
-            f"fail={fail_pct:5.1f}% | "
-            f"win={n_window}/{self._window.maxlen} | "
-            f"total={self._total_seen}"
+        fail_pct = (self._failures / n_window) * 100
+        avg_jitter = self._jitter_sum_ns / (n_window * NS_PER_MS)
+
+        return self._FMT % (
+            avg_jitter,
+            self._last_status,
+            fail_pct,
+            n_window,
+            self._window_size,
+            self._total_seen,
         )
@@ -0,0 +1,80 @@
+"""Healthcheck probe for container orchestration (client of the liveness endpoint)."""
+
+import http.client
+import logging
+import socket
+
+from src.adapters.driven.logging.logging_config import configure_logs
+from src.ports.health import HEALTH_ROUTE, HEALTH_SOCKET_PATH
+
+__all__ = ["main", "probe_health_socket"]
+
+logger = logging.getLogger(__name__)
+
+PROBE_TIMEOUT = 3
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        """Connect to the Unix socket instead of a TCP host."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+def probe_health_socket(socket_path: str = HEALTH_SOCKET_PATH) -> int:
+    """Query the running service's liveness endpoint.
+
+    Args:
+        socket_path: Unix socket the service listens on.
+
+    Returns:
+        HTTP status code of the liveness response.
+
+    Raises:
+        OSError: If the socket is missing or the service does not answer.
+        http.client.HTTPException: If the answer is not valid HTTP.
+    """
+    conn = _UnixHTTPConnection(socket_path, timeout=PROBE_TIMEOUT)
+    try:
+        conn.request("GET", HEALTH_ROUTE)
+        return conn.getresponse().status
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    """Run health check for container orchestration.
+
+    Asks the running propagator, over its Unix socket, whether its main loop
+    is still ticking. Configuration is not reloaded here: it is validated
+    once at service startup, so probes stay cheap.
+
+    Returns:
+        0 if healthy, 1 if unhealthy.
+    """
+    configure_logs()
+
+    try:
+        status = probe_health_socket()
+    except (OSError, http.client.HTTPException) as exc:
+        logger.error("Propagator healthcheck FAILED: %s", exc)
+        return 1
+
+    if status != 200:
+        logger.error("Propagator healthcheck FAILED: liveness returned status %s", status)
+        return 1
+
+    logger.info("Propagator healthcheck OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
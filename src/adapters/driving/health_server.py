@@ -0,0 +1,116 @@
+"""Liveness endpoint served by the running service on a Unix socket."""
+
+import logging
+import os
+import time
+from types import TracebackType
+
+from aiohttp import web
+
+from src.ports.health import HEALTH_ROUTE, HEALTH_SOCKET_PATH
+
+__all__ = ["HealthServer"]
+
+logger = logging.getLogger(__name__)
+
+# The main loop counts as stalled after this many periods without a tick
+MISSED_TICKS_BEFORE_UNHEALTHY = 3
+MIN_HEARTBEAT_TIMEOUT = 5.0
+
+
+class HealthServer:
+    """HTTP liveness endpoint on a Unix domain socket.
+
+    The main loop calls beat() on every tick; GET HEALTH_ROUTE answers 200
+    while beats keep coming and 503 before the first one or once the loop
+    has stalled. Container probes query the already-running process, so a
+    probe costs one socket round-trip instead of a full interpreter start
+    with configuration loading.
+
+    Use as an async context manager to bind and release the socket.
+    """
+
+    def __init__(self, period_in_sec: float, socket_path: str = HEALTH_SOCKET_PATH) -> None:
+        """Initialize health server.
+
+        Args:
+            period_in_sec: Main loop period, used to decide when it has stalled.
+            socket_path: Filesystem path of the Unix socket to listen on.
+        """
+        self.socket_path = socket_path
+        self.heartbeat_timeout = max(
+            MIN_HEARTBEAT_TIMEOUT, period_in_sec * MISSED_TICKS_BEFORE_UNHEALTHY
+        )
+        self._last_beat: float | None = None
+        self._runner: web.AppRunner | None = None
+
+    def beat(self) -> None:
+        """Record that the main loop is making progress."""
+        self._last_beat = time.monotonic()
+
+    def is_alive(self) -> bool:
+        """Tell whether the main loop has ticked recently.
+
+        Returns:
+            True if the last beat is more recent than the heartbeat timeout.
+        """
+        if self._last_beat is None:
+            return False
+        return time.monotonic() - self._last_beat <= self.heartbeat_timeout
+
+    async def _handle_health(self, _: web.Request) -> web.Response:
+        """Answer liveness probes.
+
+        Returns:
+            200 if alive, 503 otherwise.
+        """
+        if self.is_alive():
+            return web.Response(text="OK")
+        return web.Response(status=503, text="UNHEALTHY")
+
+    async def __aenter__(self) -> "HealthServer":
+        """Start serving on the Unix socket.
+
+        A stale socket file left by a previous process is removed first.
+
+        Returns:
+            Self for use in async with statement.
+
+        Raises:
+            OSError: If the socket cannot be bound (e.g. read-only directory).
+        """
+        app = web.Application()
+        app.router.add_get(HEALTH_ROUTE, self._handle_health)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        try:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            await web.UnixSite(self._runner, self.socket_path).start()
+        except OSError:
+            # __aexit__ is not called when entering fails: release the runner here
+            await self._runner.cleanup()
+            self._runner = None
+            raise
+        logger.info("Liveness endpoint listening on unix:%s", self.socket_path)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop serving and remove the socket file.
+
+        Args:
+            exc_type: Exception type if raised in context.
+            exc: Exception instance if raised in context.
+            tb: Traceback if raised in context.
+        """
+        if self._runner:
+            await self._runner.cleanup()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
@@ -3,94 +3,209 @@
 import asyncio
 import logging
 import random
+import time
 from collections.abc import Awaitable, Callable
 
 from aiohttp import ClientResponse
 from aiohttp.client_exceptions import ClientConnectorError
 
-from src.ports.http import HttpPort
+from src.ports.http import HttpPort, max_inflight_requests
 from src.ports.settings import SettingsPort
 
-__all__ = ["start_main_loop", "get_now_time"]
+__all__ = ["StopFlag", "start_main_loop"]
 
 logger = logging.getLogger(__name__)
 
+# Events waiting for a free worker before new ones are dropped (at least one
+# tick's worth)
+MAX_QUEUED_REQUESTS = 100
+NS_PER_SEC = 1_000_000_000
+# Payload picks drawn per batch, so the PRNG is entered once per batch
+PICK_BATCH_SIZE = 1024
 
-def get_now_time() -> float:
-    """Get current monotonic time in seconds.
+# Private PRNG for payload picks (not shared with other users of `random`)
+_picker = random.Random()
 
-    Uses event loop's monotonic clock for accurate scheduling
-    without wall-clock drift.
+
+class StopFlag:
+    """Stop condition for start_main_loop that can also cut its sleep short.
+
+    Calling the flag tells whether a stop was requested, so it can be passed
+    as stop_fn. set() requests the stop and wakes the loop polling this flag
+    from its inter-tick sleep, so it exits right away instead of up to one
+    period later. Each flag holds its own wake-up handle: separate loops
+    never interfere.
+    """
+
+    __slots__ = ("stopped", "_waiter")
+
+    def __init__(self) -> None:
+        """Initialize the flag as not stopped."""
+        self.stopped = False
+        self._waiter: asyncio.Future[None] | None = None
+
+    def __call__(self) -> bool:
+        """Tell whether a stop has been requested.
+
+        Returns:
+            True once set() has been called.
+        """
+        return self.stopped
+
+    def set(self) -> None:
+        """Request the stop and wake the loop if it is sleeping."""
+        self.stopped = True
+        if self._waiter is not None:
+            _wake(self._waiter)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    """Resolve a sleep waiter unless it is already done (woken or cancelled)."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def _sleep(delay: float, stop_flag: StopFlag | None) -> None:
+    """Sleep for `delay` seconds, or until `stop_flag` is set.
+
+    Waits on a bare future resolved by a loop timer, so no Task is allocated
+    per tick.
+
+    Args:
+        delay: Seconds to sleep (0 just yields to the event loop).
+        stop_flag: Optional flag whose set() ends the sleep early.
+    """
+    loop = asyncio.get_running_loop()
+    waiter: asyncio.Future[None] = loop.create_future()
+    timer = loop.call_later(delay, _wake, waiter)
+    if stop_flag is not None:
+        stop_flag._waiter = waiter
+    try:
+        await waiter
+    finally:
+        timer.cancel()
+        if stop_flag is not None:
+            stop_flag._waiter = None
+
+
+def _draw_picks(bodies: tuple[bytes, ...], k: int) -> list[bytes]:
+    """Draw k random payload bodies (with replacement).
+
+    When the number of bodies is a power of two, each index is taken straight
+    from getrandbits(); otherwise random floats are scaled by choices().
+
+    Args:
+        bodies: Non-empty tuple of payload bodies to pick from.
+        k: Number of picks.
 
     Returns:
-        Current time in seconds (monotonic).
+        List of k picked bodies.
     """
-    return asyncio.get_running_loop().time()
+    n = len(bodies)
+    if n & (n - 1) == 0:
+        bits = (n - 1).bit_length()
+        getrandbits = _picker.getrandbits
+        return [bodies[getrandbits(bits)] for _ in range(k)]
+    return _picker.choices(bodies, k=k)
 
 
 async def start_main_loop(
     settings: SettingsPort,
     stop_fn: Callable[[], bool],
     request_fn: Callable[[HttpPort], Awaitable[ClientResponse]],
+    on_tick: Callable[[], None] | None = None,
 ) -> None:
     """Run the main scheduling loop.
 
     Periodically:
-    1. Select a random payload.
-    2. Schedule an HTTP request as a background task (fire-and-forget).
+    1. Take the next random pre-serialized payload bodies from a pre-drawn batch.
+    2. Enqueue `settings.concurrency` HTTP requests for the pool of send workers.
     3. Sleep to maintain the configured period (based on monotonic time).
-    4. Repeat until stop_fn() returns True, then cancel in-flight tasks.
+    4. Repeat until stop_fn() returns True, then cancel the workers.
 
     Args:
-        settings: Runtime configuration (period, endpoint, payloads).
-        stop_fn: Callable that returns True when loop should exit.
+        settings: Runtime configuration (period, endpoint, payload bodies, concurrency).
+        stop_fn: Callable that returns True when loop should exit. Pass a
+            StopFlag to also be able to wake the loop from its sleep.
         request_fn: Async function used to send one HTTP request.
+        on_tick: Optional callback invoked on every tick (e.g. liveness heartbeat).
 
     Notes:
-        - The loop never awaits individual requests: each send runs in its own
-          asyncio.Task so that scheduling stays periodic even if the consumer
-          is slow.
-        - On shutdown (stop_fn() -> True), all pending request tasks are
-          cancelled and awaited to ensure a clean exit.
+        - The loop never awaits individual requests: max_inflight_requests()
+          long-lived workers drain a bounded queue so that scheduling stays
+          periodic even if the consumer is slow, without allocating a Task
+          per tick.
+        - If the consumer is so slow that MAX_QUEUED_REQUESTS events pile up,
+          new events are dropped (and logged) instead of growing memory.
+        - On shutdown (stop_fn() -> True), and also if the loop is cancelled or
+          fails, the workers and any in-flight requests are cancelled and
+          awaited to ensure a clean exit.
+        - StopFlag.set() cuts the current inter-tick sleep short, so the stop
+          condition is re-checked right away.
     """
-    next_tick: float = get_now_time()
-    pending: set[asyncio.Task[None]] = set()
     loop = asyncio.get_running_loop()
-
-    async def _run_once(req: HttpPort) -> None:
-        """Run one request and handle/log errors."""
-        try:
-            await request_fn(req)
-        except ClientConnectorError as e:
-            logger.warning(f"Consumer unreachable: {e}")
-        except asyncio.CancelledError:
-            logger.info("Shutdown requested (task cancelled).")
-        except KeyboardInterrupt:
-            logger.info("Shutdown requested (keyboard interrupt).")
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Unexpected error in send task: {e}", exc_info=True)
-        finally:
-            task = asyncio.current_task()
-            if task is not None:
-                pending.discard(task)
-
-    while not stop_fn():
-        randomized_payload = random.choice(settings.payloads)
-        request_args = HttpPort(
-            ideal_time_sec=next_tick,
-            url=settings.http_post_endpoint,
-            payload=randomized_payload,
-        )
-
-        # Fire and forget
-        task: asyncio.Task[None] = loop.create_task(_run_once(request_args))
-        pending.add(task)
-
-        next_tick += settings.period_in_sec
-        sleep_duration = max(0, next_tick - get_now_time())
-        await asyncio.sleep(sleep_duration)
-
-    if pending:
-        for task in pending:
-            task.cancel()
-        await asyncio.gather(*pending, return_exceptions=True)
+    concurrency = settings.concurrency
+    queue: asyncio.Queue[HttpPort] = asyncio.Queue(maxsize=max(MAX_QUEUED_REQUESTS, concurrency))
+
+    async def _worker() -> None:
+        """Send queued requests one at a time and handle/log errors."""
+        while True:
+            req = await queue.get()
+            try:
+                await request_fn(req)
+            except ClientConnectorError as e:
+                logger.warning("Consumer unreachable: %s", e)
+            except Exception as e:  # noqa: BLE001
+                logger.error("Unexpected error in send task: %s", e, exc_info=True)
+
+    n_workers = max_inflight_requests(concurrency)
+    workers = [loop.create_task(_worker()) for _ in range(n_workers)]
+
+    try:
+        # Settings are already validated and immutable: resolve them once, not per tick
+        url = settings.http_post_endpoint
+        bodies = tuple(settings.payload_bodies)
+        period_ns = round(settings.period_in_sec * NS_PER_SEC)
+
+        # Bind hot-path callables locally to skip attribute lookups on every tick
+        monotonic_ns = time.monotonic_ns
+        enqueue = queue.put_nowait
+
+        picks = _draw_picks(bodies, PICK_BATCH_SIZE)
+        pick_cursor = 0
+
+        # Ticks are integer nanoseconds, so the schedule never accumulates float error
+        next_tick_ns = monotonic_ns()
+        stop_flag = stop_fn if isinstance(stop_fn, StopFlag) else None
+
+        while not stop_fn():
+            if on_tick is not None:
+                on_tick()
+
+            for sent in range(concurrency):
+                if pick_cursor == PICK_BATCH_SIZE:
+                    picks = _draw_picks(bodies, PICK_BATCH_SIZE)
+                    pick_cursor = 0
+                request_args = HttpPort(
+                    ideal_time_ns=next_tick_ns, url=url, body=picks[pick_cursor]
+                )
+                pick_cursor += 1
+
+                try:
+                    enqueue(request_args)
+                except asyncio.QueueFull:
+                    logger.warning(
+                        "Send queue full (consumer too slow), dropping %d event(s).",
+                        concurrency - sent,
+                    )
+                    break
+
+            next_tick_ns += period_ns
+            await _sleep(max(0, next_tick_ns - monotonic_ns()) / NS_PER_SEC, stop_flag)
+
+        logger.info("Shutdown requested, cancelling send workers.")
+    finally:
+        for worker in workers:
+            worker.cancel()
+        # Unlike gather, wait builds no result list and never re-raises
+        await asyncio.wait(workers)
@@ -2,13 +2,17 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
+from contextlib import AsyncExitStack
 
 from src.adapters.driven.config.settings import load_settings
 from src.adapters.driven.http.client import HttpClient
 from src.adapters.driven.logging.logging_config import configure_logs
 from src.adapters.driven.metrics.http_metrics import Metrics
+from src.adapters.driving.health_server import HealthServer
 from src.adapters.driving.signals import make_stop_on_sigterm
 from src.core.event_loop import start_main_loop
+from src.ports.http import max_inflight_requests
 from src.ports.settings import SettingsPort
 
 __all__ = ["main"]
@@ -23,7 +27,7 @@ async def main() -> None:
     1. Configure logging.
     2. Load and validate configuration.
     3. Optionally probe consumer health.
-    4. Run the main propagation loop.
+    4. Serve liveness on a Unix socket and run the main propagation loop.
     5. Gracefully shutdown on SIGTERM.
     """
     configure_logs()
@@ -44,25 +48,44 @@ async def main() -> None:
     settings_port = SettingsPort(
         period_in_sec=config.period_in_sec,
         http_post_endpoint=config.http_post_endpoint,
-        payloads=config.payloads,
+        payload_bodies=config.payload_bodies,
         http_health_check_endpoint=config.http_health_endpoint,
+        concurrency=config.concurrency,
     )
 
     metrics = Metrics()
-    http_client = HttpClient(metrics=metrics)
+    http_client = HttpClient(
+        metrics=metrics,
+        period_in_sec=settings_port.period_in_sec,
+        connection_limit=max_inflight_requests(settings_port.concurrency),
+    )
 
     async with http_client as http:
         if not await optional_endpoint_health_check(settings_port, http):
             return
 
-        try:
-            await start_main_loop(
-                settings=settings_port,
-                stop_fn=make_stop_on_sigterm(),
-                request_fn=http.request,
-            )
-        except Exception as e:
-            logger.error(f"Unhandled exception in main loop: {e}", exc_info=True)
+        async with AsyncExitStack() as stack:
+            health_server = HealthServer(period_in_sec=settings_port.period_in_sec)
+            try:
+                health = await stack.enter_async_context(health_server)
+            except OSError as exc:
+                logger.error(
+                    "Liveness endpoint error: %s\n"
+                    "Hint: check that the directory of %s exists and is writable.",
+                    exc,
+                    health_server.socket_path,
+                )
+                return
+
+            try:
+                await start_main_loop(
+                    settings=settings_port,
+                    stop_fn=make_stop_on_sigterm(),
+                    request_fn=http.request,
+                    on_tick=health.beat,
+                )
+            except Exception as e:
+                logger.error("Unhandled exception in main loop: %s", e, exc_info=True)
 
         logger.info("Event propagator stopped.")
 
@@ -80,11 +103,11 @@ async def optional_endpoint_health_check(settings_port: SettingsPort, http: Http
         True if healthy or check disabled, False if check failed.
     """
     if settings_port.http_health_check_endpoint:
-        logger.info(f"Performing health check on {settings_port.http_health_check_endpoint}...")
+        logger.info("Performing health check on %s...", settings_port.http_health_check_endpoint)
         if not await http.probe(url=settings_port.http_health_check_endpoint):
             logger.error(
-                f"Health check failed for {settings_port.http_health_check_endpoint}, "
-                "aborting startup"
+                "Health check failed for %s, aborting startup",
+                settings_port.http_health_check_endpoint,
             )
             return False
 
@@ -92,9 +115,28 @@ async def optional_endpoint_health_check(settings_port: SettingsPort, http: Http
     return True
 
 
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Pick the event loop implementation to run the service on.
+
+    uvloop (the optional `uvloop` extra) is a drop-in, libuv-based loop that
+    schedules callbacks, timers and sockets faster than the stdlib one.
+
+    Returns:
+        uvloop's loop factory if uvloop is installed, otherwise None
+        (asyncio's default loop).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         import logging
 
@@ -0,0 +1,8 @@
+"""Health port definition (liveness endpoint contract)."""
+
+__all__ = ["HEALTH_ROUTE", "HEALTH_SOCKET_PATH"]
+
+# Unix domain socket on which the running service exposes its liveness
+HEALTH_SOCKET_PATH = "/tmp/propagator.sock"
+# HTTP route answering 200 when the main loop is alive, 503 otherwise
+HEALTH_ROUTE = "/health"
@@ -1,23 +1,42 @@
-"""HTTP port definition (DTO)."""
+"""HTTP port definition (DTO and in-flight request limit)."""
 
 from dataclasses import dataclass
-from typing import Any
 
-__all__ = ["HttpPort"]
+__all__ = ["HttpPort", "MAX_INFLIGHT_REQUESTS", "max_inflight_requests"]
 
+# Requests kept in flight at once: the core's send workers and the HTTP
+# adapter's connection pool are both sized from this
+MAX_INFLIGHT_REQUESTS = 8
 
-@dataclass
+
+def max_inflight_requests(concurrency: int) -> int:
+    """Return how many requests may be in flight at once.
+
+    At least MAX_INFLIGHT_REQUESTS, raised so one tick's worth of
+    `concurrency` requests can all be sent in parallel.
+
+    Args:
+        concurrency: Requests sent per tick.
+
+    Returns:
+        Number of send workers, and of pooled connections to match.
+    """
+    return max(MAX_INFLIGHT_REQUESTS, concurrency)
+
+
+@dataclass(slots=True, frozen=True)
 class HttpPort:
     """HTTP request to be sent by propagator.
 
     Decouples core scheduling logic from HTTP implementation details.
+    One is allocated per tick, so it is slotted (no per-instance __dict__).
 
     Attributes:
-        ideal_time_sec: Monotonic time when request should have been sent.
+        ideal_time_ns: Monotonic time (ns) when request should have been sent.
         url: Target HTTP endpoint URL.
-        payload: JSON-serializable dictionary to send as request body.
+        body: Pre-serialized JSON request body.
     """
 
-    ideal_time_sec: float
+    ideal_time_ns: int
     url: str
-    payload: dict[str, Any]
+    body: bytes
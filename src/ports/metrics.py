@@ -2,25 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+from typing import NamedTuple, Protocol
 
 __all__ = ["HttpAttemptDto", "MetricsPort"]
 
 
-@dataclass(slots=True, frozen=True)
-class HttpAttemptDto:
+class HttpAttemptDto(NamedTuple):
     """Immutable snapshot of a single HTTP attempt.
 
+    One is built per request and only read afterwards, so it is a plain
+    tuple subtype: no __init__ in Python and no per-instance __dict__.
+
     Attributes:
-        scheduled_at_sec: Epoch seconds when attempt was queued.
-        fired_at_sec: Epoch seconds when request left the process.
+        scheduled_at_ns: Monotonic nanoseconds when attempt was scheduled.
+        fired_at_ns: Monotonic nanoseconds when request left the process.
         is_failed: True if considered failed (network error, 5xx, etc.).
         status_code: HTTP status code when response arrived; None otherwise.
     """
 
-    scheduled_at_sec: float
-    fired_at_sec: float
+    scheduled_at_ns: int
+    fired_at_ns: int
     is_failed: bool = False
     status_code: int | None = None
 
@@ -30,7 +31,7 @@ class MetricsPort(Protocol):
 
     Implementations must be async-safe and non-blocking.
     Core calls update() after each attempt; presentation layers call
-    __str__() to render summaries.
+    __str__() to render summaries when should_log() says one is due.
     """
 
     def update(self, attempt: HttpAttemptDto, /) -> None:
@@ -41,6 +42,16 @@ class MetricsPort(Protocol):
         """
         ...
 
+    def should_log(self) -> bool:
+        """Tell whether a summary is due and, if so, mark it as emitted.
+
+        Lets callers rate-limit logging instead of rendering every attempt.
+
+        Returns:
+            True if the caller should log the summary now.
+        """
+        ...
+
     def __str__(self) -> str:
         """Return concise textual summary for humans.
 
@@ -1,7 +1,7 @@
 """Settings port definition (DTO)."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any
 
 __all__ = ["SettingsPort"]
 
@@ -16,11 +16,13 @@ class SettingsPort:
     Attributes:
         period_in_sec: Seconds between event sends.
         http_post_endpoint: URL where events are sent.
-        payloads: List of JSON objects to randomly select and send.
+        payload_bodies: Pre-serialized JSON request bodies to randomly select and send.
         http_health_check_endpoint: Optional URL to probe before starting.
+        concurrency: Requests sent per period (all scheduled for the same tick).
     """
 
     period_in_sec: float
     http_post_endpoint: str
-    payloads: list[dict[str, Any]]
+    payload_bodies: Sequence[bytes]
     http_health_check_endpoint: str | None = None
+    concurrency: int = 1
@@ -4,16 +4,28 @@ import json
 import tempfile
 from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import patch
 
+import orjson
 import pytest
 
-from src.adapters.driven.config.settings import Settings, load_settings
+from src.adapters.driven.config.settings import Settings, _parse_payloads_cached, load_settings
 
 __all__ = []
 
 Payload = dict[str, int]
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache() -> Iterator[None]:
+    """Reset cached settings and payloads so each test reads its own inputs."""
+    load_settings.cache_clear()
+    _parse_payloads_cached.cache_clear()
+    yield
+    load_settings.cache_clear()
+    _parse_payloads_cached.cache_clear()
+
+
 @pytest.fixture
 def temp_payload_file() -> Iterator[tuple[str, list[Payload]]]:
     """Create temporary JSON payload file for testing.
@@ -44,6 +56,64 @@ def test_settings_loads_payloads_from_file(temp_payload_file) -> None:
     settings.load_payloads()
 
     assert settings.payloads == expected_payloads
+    assert [json.loads(b) for b in settings.payload_bodies] == expected_payloads
+    assert isinstance(settings.payload_bodies, tuple)
+
+
+@pytest.mark.parametrize(
+    "endpoint",
+    ["https://localhost:8000/event", "localhost:8000/event", "http://", "http://host:port/x"],
+)
+def test_settings_rejects_invalid_http_endpoint(endpoint: str) -> None:
+    """Settings should only accept absolute http:// endpoints with a host."""
+    with pytest.raises(ValueError, match="Invalid HTTP endpoint"):
+        Settings(period_in_sec=1, http_post_endpoint=endpoint, payload_file_path="x.json")
+
+
+def test_settings_rejects_invalid_health_endpoint() -> None:
+    """Settings should validate the optional health endpoint too."""
+    with pytest.raises(ValueError, match="Invalid health endpoint"):
+        Settings(
+            period_in_sec=1,
+            http_post_endpoint="http://localhost:8000/event",
+            http_health_endpoint="ftp://localhost/health",
+            payload_file_path="x.json",
+        )
+
+
+def test_settings_rejects_non_positive_period() -> None:
+    """Settings should reject a period that is not strictly positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        Settings(
+            period_in_sec=0,
+            http_post_endpoint="http://localhost:8000/event",
+            payload_file_path="x.json",
+        )
+
+
+def test_settings_reparses_payload_file_only_when_it_changes(temp_payload_file) -> None:
+    """Settings should reuse parsed payloads until the file is modified."""
+    filepath, expected_payloads = temp_payload_file
+    settings = Settings(
+        period_in_sec=1,
+        http_post_endpoint="http://localhost:8000/event",
+        payload_file_path=filepath,
+    )
+
+    with patch(
+        "src.adapters.driven.config.settings.orjson.loads", wraps=orjson.loads
+    ) as mock_loads:
+        settings.load_payloads()
+        settings.load_payloads()
+        assert mock_loads.call_count == 1
+        assert settings.payloads == expected_payloads
+
+        new_payloads = [{"event_type": "message", "event_payload": "changed"}]
+        Path(filepath).write_text(json.dumps(new_payloads))
+        settings.load_payloads()
+        assert mock_loads.call_count == 2
+
+    assert settings.payloads == new_payloads
 
 
 def test_settings_rejects_missing_payload_file() -> None:
@@ -112,6 +182,24 @@ def test_settings_rejects_empty_payload_file() -> None:
         Path(filepath).unlink()
 
 
+def test_settings_rejects_non_object_payload() -> None:
+    """Settings should reject a payload array containing non-object items."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump([{"event_type": "message"}, "not an object"], f)
+        filepath = f.name
+
+    try:
+        settings = Settings(
+            period_in_sec=1,
+            http_post_endpoint="http://localhost:8000/event",
+            payload_file_path=filepath,
+        )
+        with pytest.raises(ValueError, match="must be a JSON object"):
+            settings.load_payloads()
+    finally:
+        Path(filepath).unlink()
+
+
 def test_settings_load_settings_success(monkeypatch, temp_payload_file) -> None:
     """Load Settings should create Settings object when the input is valid."""
     monkeypatch.setenv("PERIOD_IN_SECONDS", "5")
@@ -124,6 +212,19 @@ def test_settings_load_settings_success(monkeypatch, temp_payload_file) -> None:
     assert isinstance(load_settings(), Settings)
 
 
+def test_settings_load_settings_is_cached(monkeypatch, temp_payload_file) -> None:
+    """Load Settings should return the same object on repeated calls."""
+    monkeypatch.setenv("PERIOD_IN_SECONDS", "5")
+    monkeypatch.setenv("HTTP_POST_ENDPOINT", "http://example.com")
+    filepath, _ = temp_payload_file
+    monkeypatch.setenv("PAYLOAD_FILE_PATH", filepath)
+
+    first = load_settings()
+    monkeypatch.setenv("PERIOD_IN_SECONDS", "10")
+
+    assert load_settings() is first
+
+
 def test_settings_load_settings_failure(monkeypatch, temp_payload_file) -> None:
     """Load Settings should raise exceptions when at least one input is invalid."""
 
@@ -135,3 +236,23 @@ def test_settings_load_settings_failure(monkeypatch, temp_payload_file) -> None:
     # Invalid Period
     with pytest.raises(RuntimeError, match="PERIOD_IN_SECONDS must be a positive integer"):
         load_settings()
+
+
+def test_settings_load_settings_reads_concurrency(monkeypatch, temp_payload_file) -> None:
+    """Load Settings should default concurrency to 1 and read CONCURRENCY when set."""
+    monkeypatch.setenv("PERIOD_IN_SECONDS", "5")
+    monkeypatch.setenv("HTTP_POST_ENDPOINT", "http://example.com")
+    filepath, _ = temp_payload_file
+    monkeypatch.setenv("PAYLOAD_FILE_PATH", filepath)
+    monkeypatch.delenv("CONCURRENCY", raising=False)
+
+    assert load_settings().concurrency == 1
+
+    load_settings.cache_clear()
+    monkeypatch.setenv("CONCURRENCY", "4")
+    assert load_settings().concurrency == 4
+
+    load_settings.cache_clear()
+    monkeypatch.setenv("CONCURRENCY", "0")
+    with pytest.raises(RuntimeError, match="CONCURRENCY must be a positive integer"):
+        load_settings()
@@ -4,9 +4,15 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiohttp import ClientResponse
-
-from src.adapters.driven.http.client import HttpClient
-from src.ports.http import HttpPort
+from yarl import URL
+
+from src.adapters.driven.http.client import (
+    JSON_HEADERS,
+    KEEPALIVE_PERIODS,
+    MIN_KEEPALIVE_TIMEOUT,
+    HttpClient,
+)
+from src.ports.http import MAX_INFLIGHT_REQUESTS, HttpPort
 from src.ports.metrics import HttpAttemptDto, MetricsPort
 
 __all__ = []
@@ -22,6 +28,10 @@ class DummyMetrics(MetricsPort):
         """Record attempt."""
         self.attempts.append(attempt)
 
+    def should_log(self) -> bool:
+        """Log on every attempt."""
+        return True
+
     def __str__(self) -> str:
         """Return string representation."""
         return f"Recorded {len(self.attempts)} attempts"
@@ -38,6 +48,20 @@ async def test_http_client_context_manager() -> None:
         assert c is client
 
 
+@pytest.mark.asyncio
+async def test_http_client_keeps_connections_alive_across_periods() -> None:
+    """HTTP client should size keep-alive from the send period."""
+    client = HttpClient(period_in_sec=60)
+
+    async with client as c:
+        assert c.session is not None
+        assert c.session.connector is not None
+        assert c.session.connector.limit == MAX_INFLIGHT_REQUESTS
+
+    assert client.keepalive_timeout == 60 * KEEPALIVE_PERIODS
+    assert HttpClient(period_in_sec=1).keepalive_timeout == MIN_KEEPALIVE_TIMEOUT
+
+
 @pytest.mark.asyncio
 async def test_http_client_with_metrics() -> None:
     """HTTP client should update metrics after request."""
@@ -49,14 +73,15 @@ async def test_http_client_with_metrics() -> None:
     mock_response.status = 201
     client.session.post = AsyncMock(return_value=mock_response)
 
-    req = HttpPort(ideal_time_sec=100.0, url="http://test/event", payload={"x": 1})
+    req = HttpPort(ideal_time_ns=100_000_000_000, url="http://test/event", body=b'{"x": 1}')
 
-    with patch("src.adapters.driven.http.client.asyncio.get_running_loop") as mock_loop:
-        mock_loop.return_value.time.return_value = 100.05
+    with patch("src.adapters.driven.http.client.time.monotonic_ns", return_value=100_050_000_000):
         resp = await client.request(req)
 
     assert resp.status == 201
     assert len(metrics.attempts) == 1
+    assert metrics.attempts[0].scheduled_at_ns == 100_000_000_000
+    assert metrics.attempts[0].fired_at_ns == 100_050_000_000
     assert metrics.attempts[0].status_code == 201
     assert metrics.attempts[0].is_failed is False
 
@@ -71,10 +96,9 @@ async def test_http_client_without_metrics() -> None:
     mock_response.status = 201
     client.session.post = AsyncMock(return_value=mock_response)
 
-    req = HttpPort(ideal_time_sec=100.0, url="http://test/event", payload={"x": 1})
+    req = HttpPort(ideal_time_ns=100_000_000_000, url="http://test/event", body=b'{"x": 1}')
 
-    with patch("src.adapters.driven.http.client.asyncio.get_running_loop") as mock_loop:
-        mock_loop.return_value.time.return_value = 100.05
+    with patch("src.adapters.driven.http.client.time.monotonic_ns", return_value=100_050_000_000):
         resp = await client.request(req)
 
     assert resp.status == 201
@@ -91,11 +115,50 @@ async def test_http_client_marks_failures() -> None:
     mock_response.status = 500
     client.session.post = AsyncMock(return_value=mock_response)
 
-    req = HttpPort(ideal_time_sec=100.0, url="http://test/event", payload={"x": 1})
+    req = HttpPort(ideal_time_ns=100_000_000_000, url="http://test/event", body=b'{"x": 1}')
 
-    with patch("src.adapters.driven.http.client.asyncio.get_running_loop") as mock_loop:
-        mock_loop.return_value.time.return_value = 100.05
+    with patch("src.adapters.driven.http.client.time.monotonic_ns", return_value=100_050_000_000):
         resp = await client.request(req)
 
     assert resp.status == 500
     assert metrics.attempts[0].is_failed is True
+
+
+@pytest.mark.asyncio
+async def test_http_client_posts_pre_serialized_body() -> None:
+    """HTTP client should send the pre-serialized body as JSON without re-encoding."""
+    client = HttpClient(metrics=None)
+    client.session = AsyncMock()
+
+    mock_response = AsyncMock(spec=ClientResponse)
+    mock_response.status = 201
+    client.session.post = AsyncMock(return_value=mock_response)
+
+    req = HttpPort(ideal_time_ns=100_000_000_000, url="http://test/event", body=b'{"x": 1}')
+    await client.request(req)
+    await client.request(req)
+
+    first_kwargs = client.session.post.call_args_list[0].kwargs
+    _, kwargs = client.session.post.call_args
+    assert kwargs["data"] == b'{"x": 1}'
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert kwargs["headers"] is first_kwargs["headers"] is JSON_HEADERS
+
+
+@pytest.mark.asyncio
+async def test_http_client_parses_url_once() -> None:
+    """HTTP client should reuse the parsed URL across requests to the same endpoint."""
+    client = HttpClient(metrics=None)
+    client.session = AsyncMock()
+
+    mock_response = AsyncMock(spec=ClientResponse)
+    mock_response.status = 201
+    client.session.post = AsyncMock(return_value=mock_response)
+
+    req = HttpPort(ideal_time_ns=100_000_000_000, url="http://test/event", body=b'{"x": 1}')
+    await client.request(req)
+    await client.request(req)
+
+    first, second = (call.args[0] for call in client.session.post.call_args_list)
+    assert isinstance(first, URL)
+    assert first is second
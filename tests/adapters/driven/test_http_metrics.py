@@ -1,10 +1,14 @@
 """Tests for HTTP metrics collection."""
 
+from unittest.mock import patch
+
 from src.adapters.driven.metrics.http_metrics import Metrics
 from src.ports.metrics import HttpAttemptDto
 
 __all__ = []
 
+NS_PER_SEC = 1_000_000_000
+
 
 def test_metrics_initialization() -> None:
     """Metrics should initialize with empty window."""
@@ -16,8 +20,8 @@ def test_metrics_records_attempt() -> None:
     """Metrics should record HTTP attempts."""
     metrics = Metrics(window_size=10)
     attempt = HttpAttemptDto(
-        scheduled_at_sec=100.0,
-        fired_at_sec=100.5,
+        scheduled_at_ns=100 * NS_PER_SEC,
+        fired_at_ns=100 * NS_PER_SEC + 500_000_000,
         is_failed=False,
         status_code=200,
     )
@@ -32,8 +36,8 @@ def test_metrics_calculates_jitter() -> None:
     """Metrics should calculate jitter correctly."""
     metrics = Metrics(window_size=10)
     attempt = HttpAttemptDto(
-        scheduled_at_sec=100.0,
-        fired_at_sec=100.1,  # 100ms later
+        scheduled_at_ns=100 * NS_PER_SEC,
+        fired_at_ns=100 * NS_PER_SEC + 100_000_000,  # 100ms later
         is_failed=False,
         status_code=200,
     )
@@ -50,9 +54,9 @@ def test_metrics_tracks_failures() -> None:
 
     # Add 8 successful and 2 failed attempts
     for i in range(8):
-        metrics.update(HttpAttemptDto(100.0 + i, 100.0 + i, False, 200))
+        metrics.update(HttpAttemptDto((100 + i) * NS_PER_SEC, (100 + i) * NS_PER_SEC, False, 200))
     for i in range(2):
-        metrics.update(HttpAttemptDto(108.0 + i, 108.0 + i, True, 500))
+        metrics.update(HttpAttemptDto((108 + i) * NS_PER_SEC, (108 + i) * NS_PER_SEC, True, 500))
 
     output = str(metrics)
     assert "fail" in output.lower()
@@ -64,7 +68,7 @@ def test_metrics_respects_window_size() -> None:
     metrics = Metrics(window_size=5)
 
     for i in range(10):
-        metrics.update(HttpAttemptDto(100.0 + i, 100.0 + i, False, 200))
+        metrics.update(HttpAttemptDto((100 + i) * NS_PER_SEC, (100 + i) * NS_PER_SEC, False, 200))
 
     output = str(metrics)
     assert "win=5/5" in output
@@ -76,7 +80,61 @@ def test_metrics_tracks_total_attempts() -> None:
     metrics = Metrics()
 
     for i in range(5):
-        metrics.update(HttpAttemptDto(100.0 + i, 100.0 + i, False, 200))
+        metrics.update(HttpAttemptDto((100 + i) * NS_PER_SEC, (100 + i) * NS_PER_SEC, False, 200))
 
     output = str(metrics)
     assert "total=5" in output
+
+
+def test_metrics_evicts_old_samples_from_aggregates() -> None:
+    """Metrics should drop evicted samples from jitter and failure stats."""
+    metrics = Metrics(window_size=2)
+
+    metrics.update(HttpAttemptDto(100 * NS_PER_SEC, 101 * NS_PER_SEC, True, 500))
+    metrics.update(HttpAttemptDto(101 * NS_PER_SEC, 101 * NS_PER_SEC, False, 200))
+    metrics.update(HttpAttemptDto(102 * NS_PER_SEC, 102 * NS_PER_SEC, False, 200))
+
+    output = str(metrics)
+    assert "jitter=  0.0 ms" in output
+    assert "fail=  0.0%" in output
+    assert "win=2/2" in output
+
+
+def test_metrics_summary_format() -> None:
+    """Metrics summary should render every field in a fixed-width one-liner."""
+    metrics = Metrics(window_size=5)
+
+    metrics.update(HttpAttemptDto(0, 12_345_678, True, 503))
+    metrics.update(HttpAttemptDto(0, 0, False, 200))
+
+    assert str(metrics) == "jitter=  6.2 ms | status=200 | fail= 50.0% | win=2/5 | total=2"
+
+
+def test_metrics_should_log_every_n_attempts() -> None:
+    """Metrics should ask for a summary on the first attempt, then every N attempts."""
+    metrics = Metrics(log_every=3, log_interval_sec=3600)
+
+    decisions = []
+    for i in range(7):
+        metrics.update(HttpAttemptDto((100 + i) * NS_PER_SEC, (100 + i) * NS_PER_SEC, False, 200))
+        decisions.append(metrics.should_log())
+
+    assert decisions == [True, False, False, True, False, False, True]
+
+
+def test_metrics_should_log_after_interval() -> None:
+    """Metrics should ask for a summary once the interval has elapsed."""
+    metrics = Metrics(log_every=1000, log_interval_sec=10)
+
+    with patch("src.adapters.driven.metrics.http_metrics.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        metrics.update(HttpAttemptDto(100 * NS_PER_SEC, 100 * NS_PER_SEC, False, 200))
+        assert metrics.should_log() is True
+
+        mock_monotonic.return_value = 105.0
+        metrics.update(HttpAttemptDto(101 * NS_PER_SEC, 101 * NS_PER_SEC, False, 200))
+        assert metrics.should_log() is False
+
+        mock_monotonic.return_value = 110.0
+        metrics.update(HttpAttemptDto(102 * NS_PER_SEC, 102 * NS_PER_SEC, False, 200))
+        assert metrics.should_log() is True
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from src.adapters.driven.http.client import HttpClient
+from src.adapters.driven.http.client import PROBE_CLIENT_TIMEOUT, HttpClient
 
 __all__ = []
 
@@ -23,6 +23,7 @@ async def test_probe_success() -> None:
 
     assert result is True
     client.session.get.assert_called_once()
+    assert client.session.get.call_args.kwargs["timeout"] is PROBE_CLIENT_TIMEOUT
 
 
 @pytest.mark.asyncio
@@ -75,3 +75,41 @@ async def test_retry_decorator_delays_between_attempts() -> None:
 
     # Should sleep between attempts (2 sleeps for 3 attempts)
     assert mock_sleep.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_decorator_reuses_last_delay_when_schedule_is_short() -> None:
+    """Retry decorator should keep using the last delay once delay_sec runs out."""
+    exc = RETRYABLE_ERRORS[0](Mock(), Mock())
+    mock_fn = AsyncMock(side_effect=exc)
+    wrapped = retry(times=4, delay_sec=(0.1, 0.2))(mock_fn)
+
+    mock_sleep = AsyncMock()
+    with (
+        patch("src.adapters.driven.http.retry.asyncio.sleep", mock_sleep),
+        pytest.raises(RETRYABLE_ERRORS[0]),
+    ):
+        await wrapped()
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.1, 0.2, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_retry_decorator_succeeds_after_transient_error() -> None:
+    """Retry decorator should return the first successful result after retrying."""
+    fake_response = AsyncMock()
+    exc = RETRYABLE_ERRORS[0](Mock(), Mock())
+    mock_fn = AsyncMock(side_effect=[exc, fake_response])
+    wrapped = retry(times=3)(mock_fn)
+
+    with patch("src.adapters.driven.http.retry.asyncio.sleep", new=AsyncMock()):
+        result = await wrapped()
+
+    assert result == fake_response
+    assert mock_fn.call_count == 2
+
+
+def test_retry_decorator_rejects_non_positive_times() -> None:
+    """Retry decorator should require at least one attempt."""
+    with pytest.raises(ValueError, match="times must be >= 1"):
+        retry(times=0)
@@ -0,0 +1,34 @@
+"""Tests for health check probe."""
+
+from unittest.mock import patch
+
+from src.adapters.driving.health_check import main
+
+__all__ = []
+
+
+def test_health_check_success() -> None:
+    """Health check should return 0 when the liveness endpoint answers 200."""
+    with patch("src.adapters.driving.health_check.probe_health_socket") as mock_probe:
+        mock_probe.return_value = 200
+        result = main()
+
+    assert result == 0
+
+
+def test_health_check_failure_on_unhealthy_status() -> None:
+    """Health check should return 1 when the liveness endpoint reports unhealthy."""
+    with patch("src.adapters.driving.health_check.probe_health_socket") as mock_probe:
+        mock_probe.return_value = 503
+        result = main()
+
+    assert result == 1
+
+
+def test_health_check_failure_when_service_unreachable() -> None:
+    """Health check should return 1 when the liveness socket cannot be reached."""
+    with patch("src.adapters.driving.health_check.probe_health_socket") as mock_probe:
+        mock_probe.side_effect = FileNotFoundError("No such file or directory")
+        result = main()
+
+    assert result == 1
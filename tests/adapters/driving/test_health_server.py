@@ -0,0 +1,52 @@
+"""Tests for the liveness endpoint served on a Unix socket."""
+
+import asyncio
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.adapters.driving.health_check import probe_health_socket
+from src.adapters.driving.health_server import HealthServer
+
+__all__ = []
+
+
+@pytest.mark.asyncio
+async def test_health_server_reports_liveness_from_heartbeats(tmp_path: Path) -> None:
+    """Health server should answer 503 until the loop beats, then 200."""
+    socket_path = str(tmp_path / "health.sock")
+
+    async with HealthServer(period_in_sec=1, socket_path=socket_path) as health:
+        assert await asyncio.to_thread(probe_health_socket, socket_path) == 503
+
+        health.beat()
+        assert await asyncio.to_thread(probe_health_socket, socket_path) == 200
+
+    assert not os.path.exists(socket_path)
+
+
+def test_health_server_is_unhealthy_when_loop_stalls() -> None:
+    """Health server should report unhealthy once beats stop for several periods."""
+    health = HealthServer(period_in_sec=10, socket_path="unused.sock")
+
+    with patch("src.adapters.driving.health_server.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        health.beat()
+
+        mock_monotonic.return_value = 129.0
+        assert health.is_alive() is True
+
+        mock_monotonic.return_value = 131.0
+        assert health.is_alive() is False
+
+
+@pytest.mark.asyncio
+async def test_health_server_raises_when_socket_cannot_be_bound(tmp_path: Path) -> None:
+    """Health server should raise OSError if its socket directory does not exist."""
+    socket_path = str(tmp_path / "missing" / "health.sock")
+
+    with pytest.raises(OSError):
+        async with HealthServer(period_in_sec=1, socket_path=socket_path):
+            pass
@@ -1,11 +1,12 @@
 """Tests for the event loop scheduling."""
 
+import asyncio
 from collections.abc import Callable
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from src.core.event_loop import start_main_loop
+from src.core.event_loop import StopFlag, _draw_picks, start_main_loop
 from src.ports.http import HttpPort
 from src.ports.settings import SettingsPort
 
@@ -43,7 +44,7 @@ def make_one_shot_stop() -> Callable[[], bool]:
 @pytest.mark.asyncio
 async def test_event_loop_calls_request_function_once() -> None:
     """Main loop should call request function exactly once."""
-    fake_payloads = [{"x": 1}, {"x": 2}]
+    fake_bodies = [b'{"x": 1}', b'{"x": 2}']
     fake_endpoint = "http://test"
 
     fake_response = AsyncMock()
@@ -55,7 +56,7 @@ async def test_event_loop_calls_request_function_once() -> None:
         settings=SettingsPort(
             period_in_sec=0,
             http_post_endpoint=fake_endpoint,
-            payloads=fake_payloads,
+            payload_bodies=fake_bodies,
         ),
         stop_fn=make_one_shot_stop(),
         request_fn=mock_request_fn,
@@ -66,13 +67,13 @@ async def test_event_loop_calls_request_function_once() -> None:
     req_arg = mock_request_fn.call_args[0][0]
     assert isinstance(req_arg, HttpPort)
     assert req_arg.url == fake_endpoint
-    assert req_arg.payload in fake_payloads
+    assert req_arg.body in fake_bodies
 
 
 @pytest.mark.asyncio
 async def test_event_loop_calls_request_function_multiple_times() -> None:
     """Main loop should call request function for each period."""
-    fake_payloads = [{"x": 1}]
+    fake_bodies = [b'{"x": 1}']
     fake_endpoint = "http://test"
 
     fake_response = AsyncMock()
@@ -84,7 +85,7 @@ async def test_event_loop_calls_request_function_multiple_times() -> None:
         settings=SettingsPort(
             period_in_sec=0,
             http_post_endpoint=fake_endpoint,
-            payloads=fake_payloads,
+            payload_bodies=fake_bodies,
         ),
         stop_fn=make_n_shot_stop(3),
         request_fn=mock_request_fn,
@@ -94,10 +95,31 @@ async def test_event_loop_calls_request_function_multiple_times() -> None:
     assert mock_request_fn.call_count == 3
 
 
+@pytest.mark.asyncio
+async def test_event_loop_calls_on_tick_every_period() -> None:
+    """Main loop should invoke the tick callback once per period."""
+    fake_bodies = [b'{"x": 1}']
+    fake_endpoint = "http://test"
+    on_tick = Mock()
+
+    await start_main_loop(
+        settings=SettingsPort(
+            period_in_sec=0,
+            http_post_endpoint=fake_endpoint,
+            payload_bodies=fake_bodies,
+        ),
+        stop_fn=make_n_shot_stop(3),
+        request_fn=AsyncMock(),
+        on_tick=on_tick,
+    )
+
+    assert on_tick.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_event_loop_selects_random_payload() -> None:
     """Main loop should select payload from available list."""
-    fake_payloads = [{"type": "A"}, {"type": "B"}, {"type": "C"}]
+    fake_bodies = [b'{"type": "A"}', b'{"type": "B"}', b'{"type": "C"}']
     fake_endpoint = "http://test"
 
     fake_response = AsyncMock()
@@ -109,20 +131,81 @@ async def test_event_loop_selects_random_payload() -> None:
         settings=SettingsPort(
             period_in_sec=0,
             http_post_endpoint=fake_endpoint,
-            payloads=fake_payloads,
+            payload_bodies=fake_bodies,
         ),
         stop_fn=make_one_shot_stop(),
         request_fn=mock_request_fn,
     )
 
     req_arg = mock_request_fn.call_args[0][0]
-    assert req_arg.payload in fake_payloads
+    assert req_arg.body in fake_bodies
+
+
+@pytest.mark.asyncio
+async def test_event_loop_refills_payload_picks_when_batch_is_used_up() -> None:
+    """Main loop should draw a new batch of picks once the current one runs out."""
+    fake_bodies = [b'{"type": "A"}', b'{"type": "B"}']
+    mock_request_fn = AsyncMock()
+
+    with (
+        patch("src.core.event_loop.PICK_BATCH_SIZE", 2),
+        patch("src.core.event_loop._draw_picks", wraps=_draw_picks) as mock_draw,
+    ):
+        await start_main_loop(
+            settings=SettingsPort(
+                period_in_sec=0,
+                http_post_endpoint="http://test",
+                payload_bodies=fake_bodies,
+            ),
+            stop_fn=make_n_shot_stop(n=5),
+            request_fn=mock_request_fn,
+        )
+
+    assert mock_draw.call_count == 3
+    assert mock_request_fn.call_count == 5
+    assert all(call.args[0].body in fake_bodies for call in mock_request_fn.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_event_loop_sends_concurrency_requests_per_tick() -> None:
+    """Main loop should enqueue `concurrency` requests sharing each tick's ideal time."""
+    mock_request_fn = AsyncMock()
+
+    async def skip_period(*_: object) -> None:
+        await asyncio.sleep(0)  # yield so the workers can send
+
+    with patch("src.core.event_loop._sleep", skip_period):
+        await start_main_loop(
+            settings=SettingsPort(
+                period_in_sec=1,
+                http_post_endpoint="http://test",
+                payload_bodies=[b'{"x": 1}'],
+                concurrency=3,
+            ),
+            stop_fn=make_n_shot_stop(n=2),
+            request_fn=mock_request_fn,
+        )
+
+    reqs = [call.args[0] for call in mock_request_fn.call_args_list]
+    assert len(reqs) == 6
+    assert len({req.ideal_time_ns for req in reqs}) == 2
+
+
+@pytest.mark.parametrize("n_bodies", [1, 3, 4])
+def test_draw_picks_returns_k_bodies_from_the_population(n_bodies: int) -> None:
+    """Payload picks should cover every body, on both power-of-two and other sizes."""
+    bodies = tuple(f'{{"x": {i}}}'.encode() for i in range(n_bodies))
+
+    picks = _draw_picks(bodies, 1000)
+
+    assert len(picks) == 1000
+    assert set(picks) == set(bodies)
 
 
 @pytest.mark.asyncio
 async def test_event_loop_handles_request_errors_gracefully() -> None:
     """Main loop should continue after request errors."""
-    fake_payloads = [{"x": 1}]
+    fake_bodies = [b'{"x": 1}']
     fake_endpoint = "http://test"
 
     mock_request_fn = AsyncMock(side_effect=RuntimeError("Connection failed"))
@@ -132,7 +215,7 @@ async def test_event_loop_handles_request_errors_gracefully() -> None:
         settings=SettingsPort(
             period_in_sec=0,
             http_post_endpoint=fake_endpoint,
-            payloads=fake_payloads,
+            payload_bodies=fake_bodies,
         ),
         stop_fn=make_one_shot_stop(),
         request_fn=mock_request_fn,
@@ -144,7 +227,7 @@ async def test_event_loop_handles_request_errors_gracefully() -> None:
 @pytest.mark.asyncio
 async def test_event_loop_respects_period() -> None:
     """Main loop should sleep for correct duration between requests."""
-    fake_payloads = [{"x": 1}]
+    fake_bodies = [b'{"x": 1}']
     fake_endpoint = "http://test"
     period = 5.0
 
@@ -154,12 +237,12 @@ async def test_event_loop_respects_period() -> None:
     mock_request_fn = AsyncMock(return_value=fake_response)
     mock_sleep = AsyncMock()
 
-    with patch("src.core.event_loop.asyncio.sleep", mock_sleep):
+    with patch("src.core.event_loop._sleep", mock_sleep):
         await start_main_loop(
             settings=SettingsPort(
                 period_in_sec=period,
                 http_post_endpoint=fake_endpoint,
-                payloads=fake_payloads,
+                payload_bodies=fake_bodies,
             ),
             stop_fn=make_one_shot_stop(),
             request_fn=mock_request_fn,
@@ -167,3 +250,151 @@ async def test_event_loop_respects_period() -> None:
 
     # Should sleep between attempts
     mock_sleep.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_event_loop_sleeps_until_next_deadline_without_drift() -> None:
+    """Main loop should sleep to absolute tick deadlines, absorbing time spent per tick."""
+    mock_sleep = AsyncMock()
+    # Start at 0 s, then wake up late by 0.3 s, 0.25 s and (overrun) 1.5 s
+    clock_ns = [0, 300_000_000, 1_250_000_000, 3_500_000_000]
+
+    with (
+        patch("src.core.event_loop._sleep", mock_sleep),
+        patch("src.core.event_loop.time.monotonic_ns", side_effect=clock_ns),
+    ):
+        await start_main_loop(
+            settings=SettingsPort(
+                period_in_sec=1,
+                http_post_endpoint="http://test",
+                payload_bodies=[b'{"x": 1}'],
+            ),
+            stop_fn=make_n_shot_stop(n=3),
+            request_fn=AsyncMock(),
+        )
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.7, 0.75, 0]
+
+
+@pytest.mark.asyncio
+async def test_event_loop_bounds_in_flight_requests_and_cancels_on_stop() -> None:
+    """Main loop should cap in-flight sends and cancel them on shutdown."""
+    fake_bodies = [b'{"x": 1}']
+    fake_endpoint = "http://test"
+
+    async def never_responds(_: HttpPort) -> None:
+        await asyncio.Event().wait()
+
+    mock_request_fn = AsyncMock(side_effect=never_responds)
+
+    with (
+        patch("src.ports.http.MAX_INFLIGHT_REQUESTS", 1),
+        patch("src.core.event_loop.MAX_QUEUED_REQUESTS", 1),
+    ):
+        await start_main_loop(
+            settings=SettingsPort(
+                period_in_sec=0,
+                http_post_endpoint=fake_endpoint,
+                payload_bodies=fake_bodies,
+            ),
+            stop_fn=make_n_shot_stop(5),
+            request_fn=mock_request_fn,
+        )
+
+    # Only one worker: the first request hangs, the rest queue up or get dropped
+    mock_request_fn.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stops_without_waiting_for_period() -> None:
+    """Main loop should exit promptly when its sleep is interrupted after stop."""
+    fake_bodies = [b'{"x": 1}']
+    fake_endpoint = "http://test"
+    stop_flag = StopFlag()
+
+    mock_request_fn = AsyncMock()
+
+    loop_task = asyncio.create_task(
+        start_main_loop(
+            settings=SettingsPort(
+                period_in_sec=3600,
+                http_post_endpoint=fake_endpoint,
+                payload_bodies=fake_bodies,
+            ),
+            stop_fn=stop_flag,
+            request_fn=mock_request_fn,
+        )
+    )
+    await asyncio.sleep(0.01)
+
+    stop_flag.set()
+
+    await asyncio.wait_for(loop_task, timeout=1)
+    mock_request_fn.assert_called_once()
+
+
+def _other_tasks() -> set[asyncio.Task[object]]:
+    """Return the tasks still alive besides the running test itself."""
+    return {task for task in asyncio.all_tasks() if task is not asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_event_loop_cancels_workers_when_cancelled() -> None:
+    """Main loop should not leave send workers behind when its own task is cancelled."""
+    loop_task = asyncio.create_task(
+        start_main_loop(
+            settings=SettingsPort(
+                period_in_sec=3600,
+                http_post_endpoint="http://test",
+                payload_bodies=[b'{"x": 1}'],
+            ),
+            stop_fn=lambda: False,
+            request_fn=AsyncMock(),
+        )
+    )
+    await asyncio.sleep(0.01)
+
+    loop_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await loop_task
+
+    assert not _other_tasks()
+
+
+@pytest.mark.asyncio
+async def test_event_loop_cancels_workers_when_tick_fails() -> None:
+    """Main loop should propagate a failing on_tick and still cancel its workers."""
+    with pytest.raises(RuntimeError, match="heartbeat failed"):
+        await start_main_loop(
+            settings=SettingsPort(
+                period_in_sec=0,
+                http_post_endpoint="http://test",
+                payload_bodies=[b'{"x": 1}'],
+            ),
+            stop_fn=lambda: False,
+            request_fn=AsyncMock(),
+            on_tick=Mock(side_effect=RuntimeError("heartbeat failed")),
+        )
+
+    assert not _other_tasks()
+
+
+@pytest.mark.asyncio
+async def test_stop_flag_wakes_only_its_own_loop() -> None:
+    """Setting one loop's StopFlag should not wake or stop another running loop."""
+    settings = SettingsPort(
+        period_in_sec=3600,
+        http_post_endpoint="http://test",
+        payload_bodies=[b'{"x": 1}'],
+    )
+    first_flag, second_flag = StopFlag(), StopFlag()
+    first = asyncio.create_task(start_main_loop(settings, first_flag, AsyncMock()))
+    second = asyncio.create_task(start_main_loop(settings, second_flag, AsyncMock()))
+    await asyncio.sleep(0.01)
+
+    first_flag.set()
+    await asyncio.wait_for(first, timeout=1)
+    assert not second.done()
+
+    second_flag.set()
+    await asyncio.wait_for(second, timeout=1)
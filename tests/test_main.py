@@ -1,11 +1,14 @@
 """Tests for main application entrypoint."""
 
+import sys
+import types
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from src.adapters.driven.http.client import HttpClient
-from src.main import main, optional_endpoint_health_check
+from src.main import event_loop_factory, main, optional_endpoint_health_check
+from src.ports.http import max_inflight_requests
 from src.ports.settings import SettingsPort
 
 __all__ = []
@@ -17,7 +20,7 @@ async def test_optional_endpoint_health_check_when_disabled() -> None:
     settings = SettingsPort(
         period_in_sec=1,
         http_post_endpoint="http://localhost:8000/event",
-        payloads=[{"test": "payload"}],
+        payload_bodies=[b'{"test": "payload"}'],
         http_health_check_endpoint=None,  # Disabled
     )
     http_client = HttpClient()
@@ -33,7 +36,7 @@ async def test_optional_endpoint_health_check_succeeds() -> None:
     settings = SettingsPort(
         period_in_sec=1,
         http_post_endpoint="http://localhost:8000/event",
-        payloads=[{"test": "payload"}],
+        payload_bodies=[b'{"test": "payload"}'],
         http_health_check_endpoint="http://localhost:8000/health",
     )
     http_client = HttpClient()
@@ -52,7 +55,7 @@ async def test_optional_endpoint_health_check_fails() -> None:
     settings = SettingsPort(
         period_in_sec=1,
         http_post_endpoint="http://localhost:8000/event",
-        payloads=[{"test": "payload"}],
+        payload_bodies=[b'{"test": "payload"}'],
         http_health_check_endpoint="http://localhost:8000/health",
     )
     http_client = HttpClient()
@@ -72,6 +75,7 @@ async def test_main_starts_and_runs_successfully() -> None:
         patch("src.main.load_settings") as mock_load_settings,
         patch("src.main.HttpClient") as mock_http_client_class,
         patch("src.main.Metrics"),
+        patch("src.main.HealthServer"),
         patch("src.main.make_stop_on_sigterm"),
         patch("src.main.start_main_loop", new_callable=AsyncMock),
         patch("src.main.optional_endpoint_health_check", new_callable=AsyncMock) as mock_health,
@@ -81,7 +85,8 @@ async def test_main_starts_and_runs_successfully() -> None:
         mock_config.period_in_sec = 5
         mock_config.http_post_endpoint = "http://localhost:8000/event"
         mock_config.http_health_endpoint = None
-        mock_config.payloads = [{"test": "payload"}]
+        mock_config.payload_bodies = [b'{"test": "payload"}']
+        mock_config.concurrency = 1
         mock_load_settings.return_value = mock_config
 
         mock_http_client = AsyncMock()
@@ -96,6 +101,10 @@ async def test_main_starts_and_runs_successfully() -> None:
         # Verify calls
         mock_load_settings.assert_called_once()
         mock_health.assert_called_once()
+        # Connection pool sized like the core's send workers
+        assert mock_http_client_class.call_args.kwargs["connection_limit"] == max_inflight_requests(
+            mock_config.concurrency
+        )
 
 
 @pytest.mark.asyncio
@@ -106,6 +115,7 @@ async def test_main_aborts_on_health_check_failure() -> None:
         patch("src.main.load_settings") as mock_load_settings,
         patch("src.main.HttpClient") as mock_http_client_class,
         patch("src.main.Metrics"),
+        patch("src.main.HealthServer"),
         patch("src.main.make_stop_on_sigterm"),
         patch("src.main.start_main_loop", new_callable=AsyncMock) as mock_loop,
         patch("src.main.optional_endpoint_health_check", new_callable=AsyncMock) as mock_health,
@@ -115,7 +125,8 @@ async def test_main_aborts_on_health_check_failure() -> None:
         mock_config.period_in_sec = 5
         mock_config.http_post_endpoint = "http://localhost:8000/event"
         mock_config.http_health_endpoint = "http://localhost:8000/health"
-        mock_config.payloads = [{"test": "payload"}]
+        mock_config.payload_bodies = [b'{"test": "payload"}']
+        mock_config.concurrency = 1
         mock_load_settings.return_value = mock_config
 
         mock_http_client = AsyncMock()
@@ -139,6 +150,7 @@ async def test_main_continues_on_loop_exception() -> None:
         patch("src.main.load_settings") as mock_load_settings,
         patch("src.main.HttpClient") as mock_http_client_class,
         patch("src.main.Metrics"),
+        patch("src.main.HealthServer"),
         patch("src.main.make_stop_on_sigterm"),
         patch("src.main.start_main_loop", new_callable=AsyncMock) as mock_loop,
         patch("src.main.optional_endpoint_health_check", new_callable=AsyncMock) as mock_health,
@@ -149,7 +161,8 @@ async def test_main_continues_on_loop_exception() -> None:
         mock_config.period_in_sec = 5
         mock_config.http_post_endpoint = "http://localhost:8000/event"
         mock_config.http_health_endpoint = None
-        mock_config.payloads = [{"test": "payload"}]
+        mock_config.payload_bodies = [b'{"test": "payload"}']
+        mock_config.concurrency = 1
         mock_load_settings.return_value = mock_config
         mock_http_client = AsyncMock()
         mock_http_client_class.return_value = mock_http_client
@@ -167,3 +180,54 @@ async def test_main_continues_on_loop_exception() -> None:
 
         # Verify error was logged
         mock_logger.error.assert_called()
+
+
+def test_event_loop_factory_uses_uvloop_when_installed() -> None:
+    """Event loop factory should return uvloop's factory when uvloop is importable."""
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.new_event_loop = Mock()  # type: ignore[attr-defined]
+
+    with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+        assert event_loop_factory() is fake_uvloop.new_event_loop
+
+
+def test_event_loop_factory_falls_back_to_default_loop() -> None:
+    """Event loop factory should return None (stdlib loop) when uvloop is missing."""
+    with patch.dict(sys.modules, {"uvloop": None}):
+        assert event_loop_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_main_logs_and_exits_when_liveness_socket_cannot_be_bound() -> None:
+    """Main should log a hint and not start the loop if the health socket fails to bind."""
+    with (
+        patch("src.main.configure_logs"),
+        patch("src.main.load_settings") as mock_load_settings,
+        patch("src.main.HttpClient") as mock_http_client_class,
+        patch("src.main.Metrics"),
+        patch("src.main.HealthServer") as mock_health_server_class,
+        patch("src.main.make_stop_on_sigterm"),
+        patch("src.main.start_main_loop", new_callable=AsyncMock) as mock_loop,
+        patch("src.main.optional_endpoint_health_check", new_callable=AsyncMock) as mock_health,
+        patch("src.main.logger") as mock_logger,
+    ):
+        mock_config = Mock()
+        mock_config.period_in_sec = 5
+        mock_config.http_post_endpoint = "http://localhost:8000/event"
+        mock_config.http_health_endpoint = None
+        mock_config.payload_bodies = [b'{"test": "payload"}']
+        mock_config.concurrency = 1
+        mock_load_settings.return_value = mock_config
+        mock_http_client = AsyncMock()
+        mock_http_client_class.return_value = mock_http_client
+        mock_http_client.__aenter__.return_value = mock_http_client
+        mock_health.return_value = True
+        mock_health_server_class.return_value.__aenter__.side_effect = PermissionError(
+            "Permission denied"
+        )
+
+        await main()
+
+        mock_loop.assert_not_called()
+        mock_logger.error.assert_called_once()
+        assert "Liveness endpoint error" in mock_logger.error.call_args.args[0]